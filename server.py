@@ -6,23 +6,188 @@ Author: Your Name
 Date: January 2026
 """
 
+import asyncio
+import operator
 import os
-import requests
+import time
+import httpx
+import orjson
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
 from dotenv import load_dotenv
 from fastmcp import FastMCP
+from zoneinfo import ZoneInfo
 
 # Load environment variables from .env file
 load_dotenv()
 
+# API keys are read once at import; restart after changing .env
+OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
+EXCHANGERATE_API_KEY = os.getenv("EXCHANGERATE_API_KEY")
+
+# Shared async HTTP client: keeps connections to the upstream APIs alive
+# between tool calls and lets many tool calls wait on the network at once
+# without tying up a worker thread each
+def _new_client() -> httpx.AsyncClient:
+    """Build the pooled async client used for all upstream API calls."""
+    return httpx.AsyncClient(
+        timeout=10.0,
+        headers={
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",  # Decompressed transparently by httpx
+            "User-Agent": "mcp-tools-server/1.0"
+        },
+        transport=httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            retries=2  # Retry failed connection attempts
+        )
+    )
+
+
+_ACLIENT = _new_client()
+
+
+def _client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, replacing it if a shutdown closed it."""
+    # The lifespan closes the client when a server run ends, but the module
+    # outlives it: later runs (e.g. a second in-memory client session) get a
+    # fresh client instead of failing on a closed one
+    global _ACLIENT
+    if _ACLIENT.is_closed:
+        _ACLIENT = _new_client()
+    return _ACLIENT
+
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Close the shared HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await _ACLIENT.aclose()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("Tools Server")
+mcp = FastMCP("Tools Server", lifespan=_lifespan)
+
+# ============================================================================
+# RESPONSE CACHING
+# ============================================================================
+# Upstream results are cached in dicts of key -> (fetched_at, value) with two
+# TTLs: past the soft TTL the cached value is still returned while a background
+# refresh runs (stale-while-revalidate); past the hard TTL the caller waits for
+# a fresh fetch. If that fetch fails, the stale value is used (stale-if-error).
+
+# Cache keys with a background refresh already running, plus strong references
+# to those tasks so they are not garbage collected mid-flight
+_REFRESH_IN_PROGRESS: set = set()
+_BACKGROUND_TASKS: set = set()
+
+
+async def _fetch_and_store(cache: dict, key, maxsize: int | None, fetch, *args) -> dict:
+    """Call fetch(*args) and cache the result if it was successful."""
+    value = await fetch(*args)
+    
+    if value.get("status") == "success":
+        cache[key] = (time.monotonic(), value)
+        # Evict the least recently used key when a size limit is set
+        if maxsize:
+            cache.move_to_end(key)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+    
+    return value
+
+
+def _schedule_refresh(cache: dict, key, maxsize: int | None, fetch, *args) -> None:
+    """Refresh a stale cache entry in the background, at most once per key."""
+    refresh_key = (fetch, key)
+    if refresh_key in _REFRESH_IN_PROGRESS:
+        return
+    _REFRESH_IN_PROGRESS.add(refresh_key)
+    
+    async def refresh():
+        try:
+            await _fetch_and_store(cache, key, maxsize, fetch, *args)
+        except Exception:
+            pass  # Keep serving the stale entry until its hard TTL runs out
+        finally:
+            _REFRESH_IN_PROGRESS.discard(refresh_key)
+    
+    task = asyncio.create_task(refresh())
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+async def _cached_fetch(cache: dict, key, soft_ttl: float, hard_ttl: float, fetch, *args, maxsize: int | None = None) -> dict:
+    """
+    Return the cached value for key, calling fetch(*args) when it is missing or stale.
+    
+    fetch must return a tool-style dict; only results with status "success"
+    are cached. Pass maxsize (with an OrderedDict cache) to bound the cache
+    with LRU eviction.
+    """
+    entry = cache.get(key)
+    
+    if entry:
+        age = time.monotonic() - entry[0]
+        if age < hard_ttl:
+            if age >= soft_ttl:
+                _schedule_refresh(cache, key, maxsize, fetch, *args)
+            if maxsize:
+                cache.move_to_end(key)
+            return entry[1]
+    
+    try:
+        return await _fetch_and_store(cache, key, maxsize, fetch, *args)
+    except httpx.HTTPError:
+        if entry:
+            return entry[1]
+        raise
+
 
 # ============================================================================
 # TOOL 1: WEATHER TOOL
 # ============================================================================
+# OpenWeatherMap only refreshes every 10-30 minutes, so repeat lookups for the
+# same location are served from memory: location -> (fetched_at, result)
+_WEATHER_SOFT_TTL = 900  # 15 minutes
+_WEATHER_HARD_TTL = 1800  # 30 minutes
+_WEATHER_CACHE_SIZE = 512
+_WEATHER_CACHE: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+# OpenWeatherMap API endpoint
+_OWM_URL = "https://api.openweathermap.org/data/2.5/weather"
+
+
+async def _fetch_weather(location: str, api_key: str) -> dict:
+    """Fetch current weather for a location from OpenWeatherMap."""
+    params = {
+        "q": location,
+        "appid": api_key,
+        "units": "metric"  # Celsius, change to "imperial" for Fahrenheit
+    }
+    
+    response = await _client().get(_OWM_URL, params=params)
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content)
+    
+    return {
+        "location": data["name"],
+        "country": data["sys"]["country"],
+        "temperature": f"{data['main']['temp']}°C",
+        "feels_like": f"{data['main']['feels_like']}°C",
+        "description": data["weather"][0]["description"].title(),
+        "humidity": f"{data['main']['humidity']}%",
+        "wind_speed": f"{data['wind']['speed']} m/s",
+        "status": "success"
+    }
+
+
 @mcp.tool()
-def get_weather(location: str) -> dict:
+async def get_weather(location: str) -> dict:
     """
     Retrieve current weather conditions for any city or location.
     
@@ -37,7 +202,7 @@ def get_weather(location: str) -> dict:
         get_weather("10001")  # NYC ZIP code
         get_weather("Paris,FR")
     """
-    api_key = os.getenv("OPENWEATHER_API_KEY")
+    api_key = OPENWEATHER_API_KEY
     
     if not api_key:
         return {
@@ -45,35 +210,17 @@ def get_weather(location: str) -> dict:
         }
     
     try:
-        # OpenWeatherMap API endpoint
-        url = f"http://api.openweathermap.org/data/2.5/weather"
-        params = {
-            "q": location,
-            "appid": api_key,
-            "units": "metric"  # Celsius, change to "imperial" for Fahrenheit
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        return {
-            "location": data["name"],
-            "country": data["sys"]["country"],
-            "temperature": f"{data['main']['temp']}°C",
-            "feels_like": f"{data['main']['feels_like']}°C",
-            "description": data["weather"][0]["description"].title(),
-            "humidity": f"{data['main']['humidity']}%",
-            "wind_speed": f"{data['wind']['speed']} m/s",
-            "status": "success"
-        }
+        return await _cached_fetch(
+            _WEATHER_CACHE, location.strip().lower(), _WEATHER_SOFT_TTL, _WEATHER_HARD_TTL,
+            _fetch_weather, location, api_key,
+            maxsize=_WEATHER_CACHE_SIZE
+        )
         
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             return {"error": f"Location '{location}' not found", "status": "error"}
         return {"error": f"API error: {str(e)}", "status": "error"}
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"Network error: {str(e)}", "status": "error"}
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}", "status": "error"}
@@ -82,6 +229,14 @@ def get_weather(location: str) -> dict:
 # ============================================================================
 # TOOL 2: CALCULATOR TOOL
 # ============================================================================
+_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv
+}
+
+
 @mcp.tool()
 def calculate(operation: str, num1: float, num2: float) -> dict:
     """
@@ -100,29 +255,23 @@ def calculate(operation: str, num1: float, num2: float) -> dict:
         calculate("multiply", 7, 8)  # Returns 56
     """
     try:
-        operations = {
-            "add": lambda a, b: a + b,
-            "subtract": lambda a, b: a - b,
-            "multiply": lambda a, b: a * b,
-            "divide": lambda a, b: a / b if b != 0 else None
-        }
-        
         operation = operation.lower()
+        op = _OPS.get(operation)
         
-        if operation not in operations:
+        if op is None:
             return {
                 "error": f"Invalid operation '{operation}'. Use: add, subtract, multiply, divide",
                 "status": "error"
             }
         
-        result = operations[operation](num1, num2)
-        
-        if result is None:
+        if operation == "divide" and num2 == 0:
             return {
                 "error": "Cannot divide by zero",
                 "status": "error"
             }
         
+        result = op(num1, num2)
+        
         return {
             "operation": operation,
             "num1": num1,
@@ -139,8 +288,39 @@ def calculate(operation: str, num1: float, num2: float) -> dict:
 # ============================================================================
 # TOOL 3: CURRENCY CONVERTER TOOL
 # ============================================================================
+# Exchange rates only change a few times a day, so the rate for each currency
+# pair is cached and every amount is converted locally:
+# (from_currency, to_currency) -> (fetched_at, {"rate", "last_updated", "status"})
+_FX_SOFT_TTL = 3600  # 1 hour
+_FX_HARD_TTL = 21600  # 6 hours
+_FX_CACHE: dict[tuple[str, str], tuple[float, dict]] = {}
+
+
+async def _fetch_rate(from_currency: str, to_currency: str, api_key: str) -> dict:
+    """Fetch the exchange rate for a currency pair from ExchangeRate-API."""
+    # ExchangeRate-API pair endpoint (rate only, independent of amount)
+    url = f"https://v6.exchangerate-api.com/v6/{api_key}/pair/{from_currency}/{to_currency}"
+    
+    response = await _client().get(url)
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content)
+    
+    if data["result"] == "error":
+        return {
+            "error": f"Currency conversion error: {data.get('error-type', 'Unknown error')}",
+            "status": "error"
+        }
+    
+    return {
+        "rate": data["conversion_rate"],
+        "last_updated": data.get("time_last_update_utc", "N/A"),
+        "status": "success"
+    }
+
+
 @mcp.tool()
-def convert_currency(amount: float, from_currency: str, to_currency: str) -> dict:
+async def convert_currency(amount: float, from_currency: str, to_currency: str) -> dict:
     """
     Convert amount between different currencies using live exchange rates.
     
@@ -156,7 +336,7 @@ def convert_currency(amount: float, from_currency: str, to_currency: str) -> dic
         convert_currency(100, "USD", "EUR")
         convert_currency(50, "GBP", "JPY")
     """
-    api_key = os.getenv("EXCHANGERATE_API_KEY")
+    api_key = EXCHANGERATE_API_KEY
     
     if not api_key:
         return {
@@ -168,32 +348,28 @@ def convert_currency(amount: float, from_currency: str, to_currency: str) -> dic
         from_currency = from_currency.upper()
         to_currency = to_currency.upper()
         
-        # ExchangeRate-API endpoint
-        url = f"https://v6.exchangerate-api.com/v6/{api_key}/pair/{from_currency}/{to_currency}/{amount}"
+        fx = await _cached_fetch(
+            _FX_CACHE, (from_currency, to_currency), _FX_SOFT_TTL, _FX_HARD_TTL,
+            _fetch_rate, from_currency, to_currency, api_key
+        )
         
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
+        if fx["status"] == "error":
+            return fx
         
-        data = response.json()
-        
-        if data["result"] == "error":
-            return {
-                "error": f"Currency conversion error: {data.get('error-type', 'Unknown error')}",
-                "status": "error"
-            }
+        converted = round(amount * fx["rate"], 4)
         
         return {
             "amount": amount,
             "from_currency": from_currency,
             "to_currency": to_currency,
-            "conversion_rate": data["conversion_rate"],
-            "converted_amount": data["conversion_result"],
-            "formatted": f"{amount} {from_currency} = {data['conversion_result']:.2f} {to_currency}",
-            "last_updated": data.get("time_last_update_utc", "N/A"),
+            "conversion_rate": fx["rate"],
+            "converted_amount": converted,
+            "formatted": f"{amount} {from_currency} = {converted:.2f} {to_currency}",
+            "last_updated": fx["last_updated"],
             "status": "success"
         }
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"Network error: {str(e)}", "status": "error"}
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}", "status": "error"}
@@ -202,13 +378,55 @@ def convert_currency(amount: float, from_currency: str, to_currency: str) -> dic
 # ============================================================================
 # TOOL 4: TIME ZONE TOOL
 # ============================================================================
+# City to IANA timezone mapping
+_CITY_DATA = {
+    "london": "Europe/London",
+    "paris": "Europe/Paris",
+    "new york": "America/New_York",
+    "los angeles": "America/Los_Angeles",
+    "tokyo": "Asia/Tokyo",
+    "sydney": "Australia/Sydney",
+    "dubai": "Asia/Dubai",
+    "singapore": "Asia/Singapore",
+    "mumbai": "Asia/Kolkata",
+    "toronto": "America/Toronto",
+    "berlin": "Europe/Berlin",
+    "moscow": "Europe/Moscow",
+    "beijing": "Asia/Shanghai",
+    "hong kong": "Asia/Hong_Kong",
+    "chicago": "America/Chicago",
+    "mexico city": "America/Mexico_City",
+    "sao paulo": "America/Sao_Paulo",
+    "cairo": "Africa/Cairo",
+    "lagos": "Africa/Lagos",
+    "johannesburg": "Africa/Johannesburg"
+}
+_SUPPORTED_CITIES = frozenset(_CITY_DATA)
+_SUPPORTED_CITIES_STR = ", ".join(sorted(_CITY_DATA))
+_CITY_ERROR_STR = f"Supported cities: {_SUPPORTED_CITIES_STR}"
+
+# WorldTimeAPI endpoint, followed by the IANA timezone name
+_WTA_URL = "https://worldtimeapi.org/api/timezone/"
+
+# Circuit breaker: after a WorldTimeAPI failure, go straight to the calculated
+# fallback for a cooldown period instead of waiting on the API every call
+_WTA_COOLDOWN = 60  # seconds
+_WTA_BREAKER = {"opened_at": float("-inf")}
+
+
+# Timezones with full DST rules, loaded once at import; the current time for
+# any supported city is computed locally without a network round trip
+_TZ_OBJECTS = {city: ZoneInfo(tz_name) for city, tz_name in _CITY_DATA.items()}
+
+
 @mcp.tool()
-def get_timezone_info(city: str) -> dict:
+async def get_timezone_info(city: str, live: bool = False) -> dict:
     """
     Get current time and timezone information for a given city.
     
     Args:
         city: City name (e.g., "London", "New York", "Tokyo")
+        live: Also check the time against WorldTimeAPI (slower)
     
     Returns:
         Dictionary with current time, timezone, and UTC offset
@@ -216,86 +434,63 @@ def get_timezone_info(city: str) -> dict:
     Example:
         get_timezone_info("Tokyo")
         get_timezone_info("New York")
+        get_timezone_info("London", live=True)
     """
     try:
-        # City to timezone and UTC offset mapping
-        city_data = {
-            "london": {"timezone": "Europe/London", "offset": "+00:00"},
-            "paris": {"timezone": "Europe/Paris", "offset": "+01:00"},
-            "new york": {"timezone": "America/New_York", "offset": "-05:00"},
-            "los angeles": {"timezone": "America/Los_Angeles", "offset": "-08:00"},
-            "tokyo": {"timezone": "Asia/Tokyo", "offset": "+09:00"},
-            "sydney": {"timezone": "Australia/Sydney", "offset": "+11:00"},
-            "dubai": {"timezone": "Asia/Dubai", "offset": "+04:00"},
-            "singapore": {"timezone": "Asia/Singapore", "offset": "+08:00"},
-            "mumbai": {"timezone": "Asia/Kolkata", "offset": "+05:30"},
-            "toronto": {"timezone": "America/Toronto", "offset": "-05:00"},
-            "berlin": {"timezone": "Europe/Berlin", "offset": "+01:00"},
-            "moscow": {"timezone": "Europe/Moscow", "offset": "+03:00"},
-            "beijing": {"timezone": "Asia/Shanghai", "offset": "+08:00"},
-            "hong kong": {"timezone": "Asia/Hong_Kong", "offset": "+08:00"},
-            "chicago": {"timezone": "America/Chicago", "offset": "-06:00"},
-            "mexico city": {"timezone": "America/Mexico_City", "offset": "-06:00"},
-            "sao paulo": {"timezone": "America/Sao_Paulo", "offset": "-03:00"},
-            "cairo": {"timezone": "Africa/Cairo", "offset": "+02:00"},
-            "lagos": {"timezone": "Africa/Lagos", "offset": "+01:00"},
-            "johannesburg": {"timezone": "Africa/Johannesburg", "offset": "+02:00"}
-        }
+        city = city.strip()
+        city_lower = city.lower()
         
-        city_lower = city.lower().strip()
-        city_info = city_data.get(city_lower)
-        
-        if not city_info:
+        if city_lower not in _SUPPORTED_CITIES:
             return {
-                "error": f"City '{city}' not found in database. Supported cities: {', '.join(city_data.keys())}",
+                "error": f"City '{city}' not found in database. {_CITY_ERROR_STR}",
                 "status": "error"
             }
         
-        # Try WorldTimeAPI first (most accurate)
-        try:
-            url = f"http://worldtimeapi.org/api/timezone/{city_info['timezone']}"
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            dt = datetime.fromisoformat(data["datetime"].replace("Z", "+00:00"))
-            
-            return {
-                "city": city.title(),
-                "timezone": data["timezone"],
-                "current_time": dt.strftime("%Y-%m-%d %H:%M:%S"),
-                "utc_offset": data["utc_offset"],
-                "day_of_week": dt.strftime("%A"),
-                "day_of_year": data["day_of_year"],
-                "week_number": data["week_number"],
-                "status": "success"
-            }
-        except:
-            # Fallback: Calculate time using UTC offset
-            from datetime import timezone, timedelta
-            
-            # Parse offset like "+09:00" or "-05:00"
-            offset_str = city_info['offset']
-            sign = 1 if offset_str[0] == '+' else -1
-            hours, minutes = map(int, offset_str[1:].split(':'))
-            offset = timedelta(hours=sign*hours, minutes=sign*minutes)
-            
-            # Get current UTC time and apply offset
-            utc_now = datetime.now(timezone.utc)
-            local_time = utc_now + offset
-            
-            return {
-                "city": city.title(),
-                "timezone": city_info['timezone'],
-                "current_time": local_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "utc_offset": offset_str,
-                "day_of_week": local_time.strftime("%A"),
-                "day_of_year": local_time.timetuple().tm_yday,
-                "week_number": local_time.isocalendar()[1],
-                "note": "Using calculated time (WorldTimeAPI unavailable)",
-                "status": "success"
-            }
+        tz_name = _CITY_DATA[city_lower]
+        city_title = city.title()
+        
+        # Only ask WorldTimeAPI when requested, and not if it failed recently
+        if live and time.monotonic() - _WTA_BREAKER["opened_at"] >= _WTA_COOLDOWN:
+            try:
+                response = await _client().get(_WTA_URL + tz_name, timeout=5)
+                response.raise_for_status()
+                
+                data = orjson.loads(response.content)
+                dt = datetime.fromisoformat(data["datetime"])  # Accepts a trailing "Z" on 3.11+
+                
+                return {
+                    "city": city_title,
+                    "timezone": data["timezone"],
+                    "current_time": dt.strftime("%Y-%m-%d %H:%M:%S"),
+                    "utc_offset": data["utc_offset"],
+                    "day_of_week": dt.strftime("%A"),
+                    "day_of_year": data["day_of_year"],
+                    "week_number": data["week_number"],
+                    "status": "success"
+                }
+            except (httpx.HTTPError, ValueError, KeyError):
+                _WTA_BREAKER["opened_at"] = time.monotonic()
+        
+        # Calculate the time locally (DST-aware via the timezone database)
+        local_time = datetime.now(_TZ_OBJECTS[city_lower])
+        offset = local_time.strftime("%z")  # e.g. "+0530"
         
+        result = {
+            "city": city_title,
+            "timezone": tz_name,
+            "current_time": local_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "utc_offset": f"{offset[:3]}:{offset[3:]}",
+            "day_of_week": local_time.strftime("%A"),
+            "day_of_year": local_time.timetuple().tm_yday,
+            "week_number": local_time.isocalendar()[1],
+            "status": "success"
+        }
+        
+        if live:
+            result["note"] = "Using calculated time (WorldTimeAPI unavailable)"
+        
+        return result
+    
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}", "status": "error"}
 
@@ -303,6 +498,54 @@ def get_timezone_info(city: str) -> dict:
 # ============================================================================
 # TOOL 5: UNIT CONVERTER TOOL
 # ============================================================================
+# Length conversions (all to meters as base)
+_LENGTH_UNITS = {
+    "meters": 1, "m": 1,
+    "kilometers": 1000, "km": 1000,
+    "miles": 1609.34,
+    "feet": 0.3048, "ft": 0.3048,
+    "inches": 0.0254, "in": 0.0254,
+    "yards": 0.9144, "yd": 0.9144,
+    "centimeters": 0.01, "cm": 0.01,
+    "millimeters": 0.001, "mm": 0.001
+}
+
+# Weight conversions (all to kilograms as base)
+_WEIGHT_UNITS = {
+    "kilograms": 1, "kg": 1,
+    "grams": 0.001, "g": 0.001,
+    "pounds": 0.453592, "lbs": 0.453592,
+    "ounces": 0.0283495, "oz": 0.0283495,
+    "tons": 1000, "tonnes": 1000
+}
+
+_UNIT_TABLES = {"length": _LENGTH_UNITS, "weight": _WEIGHT_UNITS}
+
+# Sorted unit list per category for the invalid-unit error message
+_SUPPORTED_UNITS_STR = {category: ", ".join(sorted(units)) for category, units in _UNIT_TABLES.items()}
+
+# Direct conversion factor for every (category, from_unit, to_unit) combination
+_FACTORS: dict[tuple[str, str, str], float] = {
+    (category, from_unit, to_unit): units[from_unit] / units[to_unit]
+    for category, units in _UNIT_TABLES.items()
+    for from_unit in units
+    for to_unit in units
+}
+
+# Temperature conversions as (scale, offset) pairs: result = value * scale + offset
+_TEMP: dict[tuple[str, str], tuple[float, float]] = {
+    ("celsius", "fahrenheit"): (9/5, 32),
+    ("fahrenheit", "celsius"): (5/9, -32 * 5/9),
+    ("celsius", "kelvin"): (1, 273.15),
+    ("kelvin", "celsius"): (1, -273.15),
+    ("fahrenheit", "kelvin"): (5/9, 273.15 - 32 * 5/9),
+    ("kelvin", "fahrenheit"): (9/5, 32 - 273.15 * 9/5),
+    ("celsius", "celsius"): (1, 0),
+    ("fahrenheit", "fahrenheit"): (1, 0),
+    ("kelvin", "kelvin"): (1, 0)
+}
+
+
 @mcp.tool()
 def convert_units(value: float, from_unit: str, to_unit: str, category: str) -> dict:
     """
@@ -327,83 +570,42 @@ def convert_units(value: float, from_unit: str, to_unit: str, category: str) ->
         from_unit = from_unit.lower()
         to_unit = to_unit.lower()
         
-        # Length conversions (all to meters as base)
-        length_units = {
-            "meters": 1, "m": 1,
-            "kilometers": 1000, "km": 1000,
-            "miles": 1609.34,
-            "feet": 0.3048, "ft": 0.3048,
-            "inches": 0.0254, "in": 0.0254,
-            "yards": 0.9144, "yd": 0.9144,
-            "centimeters": 0.01, "cm": 0.01,
-            "millimeters": 0.001, "mm": 0.001
-        }
-        
-        # Weight conversions (all to kilograms as base)
-        weight_units = {
-            "kilograms": 1, "kg": 1,
-            "grams": 0.001, "g": 0.001,
-            "pounds": 0.453592, "lbs": 0.453592,
-            "ounces": 0.0283495, "oz": 0.0283495,
-            "tons": 1000, "tonnes": 1000
-        }
+        factor = _FACTORS.get((category, from_unit, to_unit))
         
-        if category == "length":
-            if from_unit not in length_units or to_unit not in length_units:
-                return {
-                    "error": f"Invalid length units. Supported: {', '.join(set(length_units.keys()))}",
-                    "status": "error"
-                }
-            
-            # Convert to meters, then to target unit
-            meters = value * length_units[from_unit]
-            result = meters / length_units[to_unit]
-            
-        elif category == "weight":
-            if from_unit not in weight_units or to_unit not in weight_units:
-                return {
-                    "error": f"Invalid weight units. Supported: {', '.join(set(weight_units.keys()))}",
-                    "status": "error"
-                }
+        if factor is not None:
+            result = value * factor
             
-            # Convert to kg, then to target unit
-            kg = value * weight_units[from_unit]
-            result = kg / weight_units[to_unit]
+        elif category in _UNIT_TABLES:
+            return {
+                "error": f"Invalid {category} units. Supported: {_SUPPORTED_UNITS_STR[category]}",
+                "status": "error"
+            }
             
         elif category == "temperature":
-            # Temperature conversions
-            if from_unit == "celsius" and to_unit == "fahrenheit":
-                result = (value * 9/5) + 32
-            elif from_unit == "fahrenheit" and to_unit == "celsius":
-                result = (value - 32) * 5/9
-            elif from_unit == "celsius" and to_unit == "kelvin":
-                result = value + 273.15
-            elif from_unit == "kelvin" and to_unit == "celsius":
-                result = value - 273.15
-            elif from_unit == "fahrenheit" and to_unit == "kelvin":
-                result = (value - 32) * 5/9 + 273.15
-            elif from_unit == "kelvin" and to_unit == "fahrenheit":
-                result = (value - 273.15) * 9/5 + 32
-            elif from_unit == to_unit:
-                result = value
-            else:
+            if (from_unit, to_unit) not in _TEMP:
                 return {
                     "error": "Invalid temperature units. Supported: celsius, fahrenheit, kelvin",
                     "status": "error"
                 }
+            
+            scale, offset = _TEMP[(from_unit, to_unit)]
+            result = value * scale + offset
+            
         else:
             return {
                 "error": f"Invalid category '{category}'. Use: length, weight, temperature",
                 "status": "error"
             }
         
+        rounded = round(result, 4)
+        
         return {
             "value": value,
             "from_unit": from_unit,
             "to_unit": to_unit,
             "category": category,
-            "result": round(result, 4),
-            "formatted": f"{value} {from_unit} = {round(result, 4)} {to_unit}",
+            "result": rounded,
+            "formatted": f"{value} {from_unit} = {rounded} {to_unit}",
             "status": "success"
         }
         
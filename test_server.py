@@ -0,0 +1,153 @@
+"""
+Offline tests for the server's response caching, WorldTimeAPI circuit breaker
+and HTTP client lifecycle. Upstream APIs are replaced with httpx.MockTransport.
+
+Usage: pytest test_server.py
+"""
+
+import asyncio
+import time
+import httpx
+import pytest
+from fastmcp import Client
+
+import server
+
+OWM_BODY = {
+    "name": "London",
+    "sys": {"country": "GB"},
+    "main": {"temp": 12.5, "feels_like": 11.0, "humidity": 80},
+    "weather": [{"description": "light rain"}],
+    "wind": {"speed": 4.1}
+}
+
+FX_BODY = {
+    "result": "success",
+    "conversion_rate": 0.9,
+    "time_last_update_utc": "Thu, 15 Oct 2026 00:00:01 +0000"
+}
+
+CACHED_WEATHER = {"location": "London", "temperature": "10.0°C", "status": "success"}
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Route every upstream call to a mock handler and record the requests.
+
+    Set upstream.error to an exception to make every call raise it.
+    """
+    class Upstream:
+        requests = []
+        error = None
+
+    def handler(request):
+        Upstream.requests.append(request)
+        if Upstream.error:
+            raise Upstream.error
+        if "openweathermap" in request.url.host:
+            return httpx.Response(200, json=OWM_BODY)
+        if "exchangerate" in request.url.host:
+            return httpx.Response(200, json=FX_BODY)
+        return httpx.Response(404)
+
+    def new_client():
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr(server, "_new_client", new_client)
+    monkeypatch.setattr(server, "_ACLIENT", new_client())
+    monkeypatch.setattr(server, "OPENWEATHER_API_KEY", "test-key")
+    monkeypatch.setattr(server, "EXCHANGERATE_API_KEY", "test-key")
+    monkeypatch.setitem(server._WTA_BREAKER, "opened_at", float("-inf"))
+    server._WEATHER_CACHE.clear()
+    server._FX_CACHE.clear()
+    yield Upstream
+    server._WEATHER_CACHE.clear()
+    server._FX_CACHE.clear()
+
+
+def _cache_weather(age):
+    """Put CACHED_WEATHER in the weather cache as if fetched age seconds ago"""
+    server._WEATHER_CACHE["london"] = (time.monotonic() - age, CACHED_WEATHER)
+
+
+def test_fresh_hit_makes_no_network_call(upstream):
+    _cache_weather(age=0)
+
+    result = asyncio.run(server.get_weather.fn("London"))
+
+    assert result == CACHED_WEATHER
+    assert upstream.requests == []
+
+
+def test_soft_stale_hit_returns_old_value_and_refreshes_once(upstream):
+    _cache_weather(age=server._WEATHER_SOFT_TTL + 1)
+
+    async def scenario():
+        first = await server.get_weather.fn("London")
+        second = await server.get_weather.fn("London")
+        await asyncio.gather(*server._BACKGROUND_TASKS)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first == second == CACHED_WEATHER
+    assert len(upstream.requests) == 1
+    assert server._WEATHER_CACHE["london"][1]["temperature"] == "12.5°C"
+
+
+def test_hard_expired_entry_is_served_when_fetch_fails(upstream):
+    _cache_weather(age=server._WEATHER_HARD_TTL + 1)
+    upstream.error = httpx.ConnectError("connection refused")
+
+    result = asyncio.run(server.get_weather.fn("London"))
+
+    assert result == CACHED_WEATHER
+    assert len(upstream.requests) == 1
+
+
+def test_fx_rate_is_reused_for_other_amounts(upstream):
+    async def scenario():
+        return (
+            await server.convert_currency.fn(100, "USD", "EUR"),
+            await server.convert_currency.fn(250, "usd", "eur")
+        )
+
+    first, second = asyncio.run(scenario())
+
+    assert first["converted_amount"] == 90.0
+    assert second["converted_amount"] == 225.0
+    assert len(upstream.requests) == 1
+
+
+def test_breaker_skips_worldtimeapi_during_cooldown(upstream):
+    upstream.error = httpx.ConnectError("connection refused")
+
+    async def scenario():
+        return (
+            await server.get_timezone_info.fn("Tokyo", live=True),
+            await server.get_timezone_info.fn("Tokyo", live=True)
+        )
+
+    first, second = asyncio.run(scenario())
+
+    assert first["status"] == second["status"] == "success"
+    assert "note" in first and "note" in second
+    assert len(upstream.requests) == 1
+
+
+def test_back_to_back_client_sessions_both_work(upstream):
+    async def call_once():
+        async with Client(server.mcp) as client:
+            result = await client.call_tool(
+                "convert_currency", {"amount": 10, "from_currency": "USD", "to_currency": "EUR"}
+            )
+            server._FX_CACHE.clear()  # Make the next session hit the client again
+            return result.data
+
+    async def scenario():
+        return await call_once(), await call_once()
+
+    first, second = asyncio.run(scenario())
+
+    assert first["status"] == second["status"] == "success"
+    assert len(upstream.requests) == 2